@@ -1,54 +1,59 @@
 from datetime import datetime, timedelta, UTC
 from fastapi import APIRouter, Depends, HTTPException, Query, Body
 from sqlalchemy.orm import Session
-from sqlalchemy import and_, asc
+from sqlalchemy import and_, asc, select
 from framework.db import get_db
 import logging
-from models.emporia import Emporia, EmporiaCreate, EmporiaSearch
+from models.emporia import Emporia, EmporiaCreate, EmporiaPage, EmporiaRead, EmporiaSearch
 from typing import Optional
 
 
 router = APIRouter()
 
-def serialize_sqlalchemy_obj(obj):
-    """
-    Convert a SQLAlchemy ORM model instance into a dictionary.
-
-    Args:
-        obj: SQLAlchemy model instance.
-
-    Returns:
-        dict: Dictionary containing all column names and their values.
-    """
-    return {column.name: getattr(obj, column.name) for column in obj.__table__.columns}
+# Mapped column attributes that search_emporia may filter on, keyed by column name
+_SEARCHABLE = {column.name: getattr(Emporia, column.name) for column in Emporia.__table__.columns}
 
-
-@router.get("/api/v1/emporia")
+@router.get("/api/v1/emporia", response_model=EmporiaPage)
 def list_emporia(
-    page: int = Query(1, ge=1, description="Page number to retrieve"),
+    after_id: Optional[int] = Query(None, ge=0, description="Return records with an ID greater than this cursor"),
+    page: int = Query(1, ge=1, deprecated=True, description="Page number to retrieve (deprecated, use after_id)"),
     limit: int = Query(10, ge=1, le=100, description="Number of records per page"),
     db: Session = Depends(get_db)
 ):
     """
-    Retrieve a paginated list of emporia records.
+    Retrieve a page of emporia records using keyset (cursor) pagination.
+
+    Records are ordered by ID. Pass the `next_cursor` from a response as
+    `after_id` to fetch the following page; this is an indexed range lookup
+    and stays constant-time regardless of how deep the client pages.
 
     Args:
-        page (int): Page number starting from 1.
+        after_id (int, optional): Only return records with an ID greater than this value.
+        page (int): Deprecated OFFSET-based page number, used only when `after_id` is omitted.
         limit (int): Maximum number of records to return per page.
         db (Session): SQLAlchemy database session.
 
     Returns:
-        list[dict]: A list of serialized emporia records.
+        EmporiaPage: `items` (the emporia records) and `next_cursor`
+                     (ID of the last record returned, or None if the page is empty).
     """
     try:
-        offset = (page - 1) * limit
-        emporia_records = db.query(Emporia).offset(offset).limit(limit).all()
-        return [serialize_sqlalchemy_obj(item) for item in emporia_records]
+        stmt = select(Emporia)
+        if after_id is not None:
+            stmt = stmt.where(Emporia.id > after_id)
+        stmt = stmt.order_by(Emporia.id.asc()).limit(limit)
+        if after_id is None and page > 1:
+            stmt = stmt.offset((page - 1) * limit)
+        emporia_records = db.scalars(stmt).all()
+        return {
+            "items": emporia_records,
+            "next_cursor": emporia_records[-1].id if emporia_records else None
+        }
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
 
 
-@router.post("/api/v1/emporia")
+@router.post("/api/v1/emporia", response_model=EmporiaRead)
 def create_record(
     emporia_data: EmporiaCreate = Body(..., description="Data for the new record"),
     db: Session = Depends(get_db)
@@ -61,7 +66,7 @@ def create_record(
         db (Session): SQLAlchemy database session.
 
     Returns:
-        dict: The newly created emporia record.
+        Emporia: The newly created emporia record.
     """
     try:
         data = emporia_data.model_dump(exclude_unset=True)
@@ -72,7 +77,7 @@ def create_record(
         db.add(new_record)
         db.commit()
         db.refresh(new_record)
-        return serialize_sqlalchemy_obj(new_record)
+        return new_record
     except HTTPException:
         raise
     except Exception as e:
@@ -80,7 +85,7 @@ def create_record(
         raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
 
 
-@router.get("/api/v1/emporia/{id}")
+@router.get("/api/v1/emporia/{id}", response_model=EmporiaRead)
 def get_emporia_by_id(id: int, db: Session = Depends(get_db)):
     """
     Retrieve a single emporia record by ID.
@@ -90,23 +95,23 @@ def get_emporia_by_id(id: int, db: Session = Depends(get_db)):
         db (Session): SQLAlchemy database session.
 
     Returns:
-        dict: The matching emporia record.
+        Emporia: The matching emporia record.
 
     Raises:
         HTTPException: If the record is not found.
     """
     try:
-        record = db.query(Emporia).filter(Emporia.id == id).first()
+        record = db.get(Emporia, id)
         if not record:
             raise HTTPException(status_code=404, detail=f"emporia with id {id} not found")
-        return serialize_sqlalchemy_obj(record)
+        return record
     except HTTPException:
         raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
 
 
-@router.put("/api/v1/emporia/{id}")
+@router.put("/api/v1/emporia/{id}", response_model=EmporiaRead)
 def update_emporia_full(
     id: int,
     emporia_data: EmporiaCreate = Body(..., description="Updated data for the record"),
@@ -121,13 +126,13 @@ def update_emporia_full(
         db (Session): SQLAlchemy database session.
 
     Returns:
-        dict: The updated emporia record.
+        Emporia: The updated emporia record.
 
     Raises:
         HTTPException: If the record is not found.
     """
     try:
-        record = db.query(Emporia).filter(Emporia.id == id).first()
+        record = db.get(Emporia, id)
         if not record:
             raise HTTPException(status_code=404, detail=f"emporia with id {id} not found")
 
@@ -138,7 +143,7 @@ def update_emporia_full(
         record.update_date = datetime.now(UTC)
         db.commit()
         db.refresh(record)
-        return serialize_sqlalchemy_obj(record)
+        return record
     except HTTPException:
         raise
     except Exception as e:
@@ -146,7 +151,7 @@ def update_emporia_full(
         raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
 
 
-@router.patch("/api/v1/emporia/{id}")
+@router.patch("/api/v1/emporia/{id}", response_model=EmporiaRead)
 def update_emporia_partial(
     id: int,
     emporia_data: EmporiaCreate = Body(..., description="Partial updated data for the record"),
@@ -161,13 +166,13 @@ def update_emporia_partial(
         db (Session): SQLAlchemy database session.
 
     Returns:
-        dict: The updated emporia record.
+        Emporia: The updated emporia record.
 
     Raises:
         HTTPException: If the record is not found.
     """
     try:
-        record = db.query(Emporia).filter(Emporia.id == id).first()
+        record = db.get(Emporia, id)
         if not record:
             raise HTTPException(status_code=404, detail=f"emporia with id {id} not found")
 
@@ -178,7 +183,7 @@ def update_emporia_partial(
         record.update_date = datetime.now(UTC)
         db.commit()
         db.refresh(record)
-        return serialize_sqlalchemy_obj(record)
+        return record
     except HTTPException:
         raise
     except Exception as e:
@@ -202,7 +207,7 @@ def delete_emporia(id: int, db: Session = Depends(get_db)):
         HTTPException: If the record is not found.
     """
     try:
-        record = db.query(Emporia).filter(Emporia.id == id).first()
+        record = db.get(Emporia, id)
         if not record:
             raise HTTPException(status_code=404, detail=f"emporia with id {id} not found")
 
@@ -216,7 +221,7 @@ def delete_emporia(id: int, db: Session = Depends(get_db)):
         raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
 
 
-@router.post("/api/v1/emporia/search")
+@router.post("/api/v1/emporia/search", response_model=list[EmporiaRead])
 def search_emporia(
     search_data: EmporiaSearch = Body(..., description="Search criteria"),
     db: Session = Depends(get_db)
@@ -242,9 +247,8 @@ def search_emporia(
 
         # Build filters for other fields (scale, device_id, channel_num, etc.)
         for field, value in data.items():
-            if hasattr(Emporia, field):
-                column = getattr(Emporia, field)
-                filters.append(column == value)
+            if field in _SEARCHABLE:
+                filters.append(_SEARCHABLE[field] == value)
 
         query = db.query(Emporia)
         if filters:
@@ -254,7 +258,7 @@ def search_emporia(
         logging.info(f'query: {query}')
         results = query.all()
 
-        return [serialize_sqlalchemy_obj(record) for record in results]
+        return results
 
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
@@ -12,8 +12,8 @@ Environment Variables for Production:
     POSTGRES_HOST     - Hostname or IP address of the database server
     POSTGRES_PORT     - Database port (default: 5432)
     POSTGRES_DB       - Database name
-    DB_POOL_SIZE      - SQLAlchemy pool size (default: 10)
-    DB_MAX_OVERFLOW   - Max overflow connections beyond pool_size (default: 20)
+    DB_POOL_SIZE      - SQLAlchemy pool size (default: 20)
+    DB_MAX_OVERFLOW   - Max overflow connections beyond pool_size (default: 10)
     DB_POOL_RECYCLE   - Connection lifetime in seconds before recycling (default: 3600)
 
 Environment Variables for Testing:
@@ -101,8 +101,8 @@ def init_db(database_url: str = None, **engine_kwargs):
                 # Default production pool config
                 pool_config = {
                     "pool_pre_ping": True,
-                    "pool_size": int(os.getenv("DB_POOL_SIZE", 10)),
-                    "max_overflow": int(os.getenv("DB_MAX_OVERFLOW", 20)),
+                    "pool_size": int(os.getenv("DB_POOL_SIZE", 20)),
+                    "max_overflow": int(os.getenv("DB_MAX_OVERFLOW", 10)),
                     "pool_recycle": int(os.getenv("DB_POOL_RECYCLE", 3600))
                 }
                 pool_config.update(engine_kwargs)
@@ -133,6 +133,8 @@ def get_db():
 
     This function is designed for use in FastAPI routes:
     - Yields a database session bound to the current request.
+    - Rolls back any open transaction if the request raises, so the connection
+      is returned to the pool clean.
     - Ensures the session is closed after the request finishes.
 
     Yields:
@@ -154,5 +156,8 @@ def get_db():
     db = SessionLocal()
     try:
         yield db
+    except Exception:
+        db.rollback()
+        raise
     finally:
         db.close()
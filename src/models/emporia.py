@@ -4,13 +4,14 @@ emporia Model and Pydantic Schema
 This module defines:
 - The SQLAlchemy ORM model for persisting emporia data.
 - The Pydantic schema for validating API requests when creating an Emporia record.
+- The Pydantic schemas used to serialize Emporia records in API responses.
 
 """
 
-from sqlalchemy import Column, DateTime, Integer, String, Float
+from sqlalchemy import Column, DateTime, Integer, String, Float, Index
 from framework.db import Base
 from datetime import datetime, UTC
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 from typing import Optional
 
 
@@ -37,6 +38,12 @@ class Emporia(Base):
     """
 
     __tablename__ = "emporia"
+    __table_args__ = (
+        # Covers search_emporia's date range + device/name filters, ordered by instant
+        Index("ix_emporia_instant_device_name", "instant", "device_id", "name"),
+        # Device-scoped time ranges
+        Index("ix_emporia_device_instant", "device_id", "instant"),
+    )
 
     id = Column(Integer, primary_key=True, autoincrement=True, index=True)
     instant = Column(DateTime, nullable=False, index=True)
@@ -102,6 +109,40 @@ class EmporiaCreate(BaseModel):
 
 
 
+class EmporiaRead(EmporiaCreate):
+    """
+    Pydantic schema for returning an emporia record from the API.
+
+    Built directly from an `Emporia` ORM instance (`from_attributes`), so
+    handlers can return ORM objects and let pydantic-core serialize them.
+
+    Attributes:
+        id (int): Primary key of the record.
+        create_date (datetime): Timestamp when the record was created (UTC).
+        update_date (datetime): Timestamp when the record was last updated (UTC).
+        (plus every field of `EmporiaCreate`)
+    """
+    model_config = ConfigDict(from_attributes=True)
+
+    id: int
+    create_date: datetime
+    update_date: datetime
+
+
+
+class EmporiaPage(BaseModel):
+    """
+    Pydantic schema for a cursor-paginated list of emporia records.
+
+    Attributes:
+        items (list[EmporiaRead]): Records in this page, ordered by ID.
+        next_cursor (int | None): Pass as `after_id` to fetch the next page.
+    """
+    items: list[EmporiaRead]
+    next_cursor: Optional[int] = None
+
+
+
 class EmporiaSearch(BaseModel):
     """
     Pydantic schema for searching for.
@@ -37,8 +37,8 @@ def test_init_db_success(monkeypatch):
         mock_engine.assert_called_once_with(
             expected_url,
             pool_pre_ping=True,
-            pool_size=10,
-            max_overflow=20,
+            pool_size=20,
+            max_overflow=10,
             pool_recycle=3600
         )
         assert db.SessionLocal is not None